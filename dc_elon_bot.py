@@ -1,7 +1,8 @@
 import os
+from collections import OrderedDict
 import discord
-from langchain.chat_models import ChatOpenAI
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+import httpx
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 # Enable logging (optional for debugging)
@@ -19,24 +20,47 @@ intents = discord.Intents.default()
 intents.messages = True
 client = discord.Client(intents=intents)
 
-# Set up the OpenAI language model
-llm = ChatOpenAI(temperature=.5, openai_api_key=OPENAI_API_KEY, model_name='gpt-3.5-turbo')
+# Set up the OpenAI client on one shared HTTP/2 connection pool
+http_client = httpx.AsyncClient(http2=True, limits=httpx.Limits(max_keepalive_connections=20))
+openai_client = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=http_client)
 
-def generate_response(message_content):
-    # Prompt template for AI to respond as Elon Musk
-    system_template = """
+# System prompt for AI to respond as Elon Musk
+system_template = """
         You are Elon Musk. Respond with authority, innovation, and unwavering confidence.
         Your words should radiate vision and ambition, sparking curiosity and driving action.
         Lean into your genius and boldness, challenging limits and embracing the future.
         Keep it concise and direct, under 200 characters.
     """
-    system_message_prompt = SystemMessagePromptTemplate.from_template(system_template)
-    human_message_prompt = HumanMessagePromptTemplate.from_template("{text}")
-    chat_prompt = ChatPromptTemplate.from_messages([system_message_prompt, human_message_prompt])
-    final_prompt = chat_prompt.format_prompt(text=message_content).to_messages()
-    
-    # Get the response from the LLM
-    response = llm(final_prompt).content
+
+# Longest message text sent to the LLM; the reply is capped at 200 characters anyway
+MAX_INPUT_CHARS = 500
+
+# Cache of recent responses so repeated messages skip the OpenAI round-trip
+RESPONSE_CACHE_SIZE = 1024
+response_cache = OrderedDict()
+
+async def generate_response(message_content):
+    message_content = message_content[:MAX_INPUT_CHARS]
+    if message_content in response_cache:
+        response_cache.move_to_end(message_content)
+        return response_cache[message_content]
+
+    # Get the response from the LLM without blocking the event loop
+    completion = await openai_client.chat.completions.create(
+        model='gpt-3.5-turbo',
+        messages=[
+            {"role": "system", "content": system_template},
+            {"role": "user", "content": message_content},
+        ],
+        temperature=.5,
+    )
+    response = completion.choices[0].message.content
+    if not response:
+        return ""  # Refusal or content-filter stop; don't cache it
+
+    response_cache[message_content] = response
+    if len(response_cache) > RESPONSE_CACHE_SIZE:
+        response_cache.popitem(last=False)
     return response
 
 # Event listener for when the bot has connected
@@ -50,9 +74,15 @@ async def on_message(message):
     if message.author == client.user:
         return  # Avoid the bot responding to itself
 
+    # Only spend an LLM call on non-empty messages from people that DM or @-mention the bot
+    addressed = message.guild is None or client.user in message.mentions
+    if message.author.bot or not message.content.strip() or not addressed:
+        return
+
     # Generate and send a response
-    response = generate_response(message.content)
-    await message.channel.send(response)
+    response = await generate_response(message.content)
+    if response:
+        await message.channel.send(response)
 
 # Run the bot with your Discord token
 client.run(os.getenv("DISCORD_BOT_TOKEN"))